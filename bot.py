@@ -1,13 +1,23 @@
 import os
+import logging
 from dotenv import load_dotenv
 import telebot
-from stegano import lsb
+from telebot import apihelper
 import io
-import tempfile
+import html
+import traceback
+from PIL import Image
+import requests
+from requests.adapters import HTTPAdapter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 
 from ciphers.ciphers import *
 from ciphers.hashing import get_str_hash, get_file_hash
+from ciphers import lsb
+from ciphers.utils import omit_blank_spaces
 
 # Load environment variables from .env file
 load_dotenv()
@@ -17,12 +27,43 @@ if not TOKEN:
     raise ValueError("TELEGRAM_BOT_TOKEN not found in environment variables")
 
 
-bot = telebot.TeleBot(TOKEN)
+logger = logging.getLogger(__name__)
 
 
-@bot.message_handler(commands=["help"])
-def help_command(message):
-    help_text = """🤖 <b>Bot Help - Available Commands</b>
+def redact(text: str) -> str:
+    """Hide the bot token, which every API and download URL embeds"""
+    return text.replace(TOKEN, "<TOKEN>")
+
+
+
+# One keep-alive session for every call to api.telegram.org, shared by the
+# bot's API calls and our own file downloads, so each request reuses a pooled
+# TLS connection instead of opening a new one
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+apihelper.session = session
+apihelper.CONNECT_TIMEOUT = 10
+apihelper.READ_TIMEOUT = 30
+
+# Handlers run on a pool of worker threads; with the default of two, a couple
+# of large uploads would hold up every other user's commands
+bot = telebot.TeleBot(TOKEN, num_threads=8)
+
+# Uploads (download, hashing, stegano) run on their own bounded pool so the
+# handler threads go straight back to quick commands like /hash and /help
+UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+FILE_URL = "https://api.telegram.org/file/bot{0}/{1}"
+CHUNK_SIZE = 64 * 1024
+MAX_FILE_SIZE = 20 * 1024 * 1024  # Bot API download limit
+MAX_HASH_TEXT_LENGTH = 4096  # Telegram's own message length limit
+# Images sent as files aren't downscaled by Telegram, and lsb copies every
+# pixel into memory, so cap the decoded size (~100 MB as RGBA)
+MAX_STEGANO_PIXELS = 25_000_000
+
+
+# Static replies and lookup tables, built once at import instead of per message
+HELP_TEXT = """🤖 <b>Bot Help - Available Commands</b>
 
     <b>🔐 HASH COMMANDS</b>
     • <code>/hash &lt;text&gt;</code> - Generate multiple hashes for text
@@ -63,7 +104,72 @@ def help_command(message):
     • All operations support both encryption and decryption
     • Hash command generates 12 different hash types"""
 
-    bot.reply_to(message, help_text, parse_mode="HTML")
+STEGANO_HELP = """🔐 **Steganography Help**
+
+**Hide message in image:**
+1. Send photo with caption: `/stegano cipher keyword your_secret_message`
+
+**Reveal hidden message:**
+1. Send photo with caption: `/stegano decipher keyword`
+
+**Example:**
+📸 Send photo + `/stegano cipher mykey Hello World!`
+📸 Send encoded photo + `/stegano decipher mykey`
+
+⚠️ **Note:** Both operations require sending a photo!"""
+
+CIPHER_USAGE = """❌ Usage: /{operation} <algorithm> [keyword] <text>
+
+        *Operations:* cipher, decipher, encrypt, decrypt
+        *Algorithms:* atbash, caesar, simple_substitution, baconian, rot13, shift, mixed_alphabet
+
+        *Examples:*
+        • /cipher atbash hello world
+        • /encrypt mixed_alphabet secret hello world
+        • /decrypt caesar hello world"""
+
+CIPHER_CLASSES = {
+    "atbash": Atbash,
+    "caesar": Caesar,
+    "simple_substitution": SimpleSubstitution,
+    "baconian": Baconian,
+    "rot13": Rot13,
+    "shift": Shift,
+    "mixed_alphabet": MixedAlphabet,
+}
+AVAILABLE_ALGOS = ", ".join(CIPHER_CLASSES)
+
+# Command name -> cipher method it runs
+OP_METHOD = {
+    "cipher": "cipher",
+    "encrypt": "cipher",
+    "decipher": "decipher",
+    "decrypt": "decipher",
+}
+
+# Ciphers are read-only once built, so one shared instance serves every
+# request; mixed_alphabet needs a keyword and shift needs a shift
+CIPHER_INSTANCES = {
+    name: cls()
+    for name, cls in CIPHER_CLASSES.items()
+    if name not in ("mixed_alphabet", "shift")
+}
+
+
+@lru_cache(maxsize=256)
+def mixed_alphabet(keyword: str) -> MixedAlphabet:
+    return MixedAlphabet(keyword)
+
+
+# Repeated /hash inputs (e.g. common passwords) become a dict lookup
+@lru_cache(maxsize=4096)
+def cached_str_hash(text: str):
+    return get_str_hash(text)
+
+
+@bot.message_handler(commands=["help"])
+def help_command(message):
+    bot.reply_to(message, HELP_TEXT, parse_mode="HTML")
 
 
 @bot.message_handler(commands=["start"])
@@ -77,114 +183,152 @@ def start_command(message):
 
 @bot.message_handler(commands=["hash"])
 def hash_command(message):
-    text = message.text.split()[1:]
-    text = "".join(text)
+    # Peel off the command once; the hashed text has all whitespace removed
+    args = message.text.split(maxsplit=1)
+    text = omit_blank_spaces(args[1]) if len(args) > 1 else ""
 
     # Check if arguments are provided FIRST
     if not text:
         bot.reply_to(message, "❌ Please provide text to hash!\nExample: /hash example")
         return
 
-    result = get_str_hash(text)
+    if len(text) > MAX_HASH_TEXT_LENGTH:
+        bot.reply_to(message, f"❌ Text too long! Maximum length: {MAX_HASH_TEXT_LENGTH} characters")
+        return
+
+    result = cached_str_hash(text)
 
     # Create formatted response
-    response = f"🔐 **Hash results for:** `{text}`\n\n"
-
-    for hash_algo, value in result.items():
-        response += f"*{hash_algo.upper()}* : `{value}`\n\n"
+    # User text is escaped so characters like <, & or ` can't break the markup
+    parts = [f"🔐 <b>Hash results for:</b> <code>{html.escape(text)}</code>"]
+    parts.extend(
+        f"<b>{hash_algo.upper()}</b> : <code>{value}</code>"
+        for hash_algo, value in result.items()
+    )
 
-    bot.reply_to(message, response, parse_mode="Markdown")
+    bot.reply_to(message, "\n\n".join(parts), parse_mode="HTML")
 
 
 @bot.message_handler(content_types=["photo", "document", "video", "audio"])
+def handle_media(message):
+    """Route uploads: a /stegano caption goes to steganography, anything else is hashed"""
+    caption = (message.caption or "").strip()
+    if caption.startswith("/stegano") and (message.photo or message.document):
+        future = UPLOAD_EXECUTOR.submit(handle_stegano_caption, message)
+    else:
+        future = UPLOAD_EXECUTOR.submit(file_hash_command, message)
+    future.add_done_callback(log_upload_error)
+
+
+def log_upload_error(future):
+    """Log anything that escaped an upload job; TeleBot never sees these"""
+    exc = future.exception()
+    if exc is not None:
+        # Format the frames ourselves: exc_info would log the unredacted message
+        logger.error(
+            "Upload job failed: %s: %s\n%s",
+            type(exc).__name__,
+            redact(str(exc)),
+            "".join(traceback.format_tb(exc.__traceback__)),
+        )
+
+
+@dataclass(frozen=True)
+class TelegramFile:
+    """A Telegram file, compared and hashed by its file_unique_id only"""
+
+    unique_id: str
+    file_id: str = field(compare=False)
+
+
+# file_unique_id is the same whenever a file is forwarded or re-sent, so a
+# repeat upload skips both the download and the hashing
+@lru_cache(maxsize=1024)
+def telegram_file_hash(file: TelegramFile):
+    file_info = bot.get_file(file.file_id)
+    # Stream the download straight into the hashers
+    with session.get(
+        FILE_URL.format(TOKEN, file_info.file_path), stream=True, timeout=30
+    ) as download:
+        download.raise_for_status()
+        return get_file_hash(download.iter_content(chunk_size=CHUNK_SIZE))
+
+
 def file_hash_command(message):
     """Handle uploaded files and generate hashes"""
     try:
         # Get file info
         if message.document:
-            file_info = bot.get_file(message.document.file_id)
+            media = message.document
             file_name = message.document.file_name or "unknown_file"
         elif message.photo:
-            file_info = bot.get_file(message.photo[-1].file_id)
+            media = message.photo[-1]
             file_name = "photo.jpg"
         elif message.video:
-            file_info = bot.get_file(message.video.file_id)
+            media = message.video
             file_name = message.video.file_name or "video.mp4"
         elif message.audio:
-            file_info = bot.get_file(message.audio.file_id)
+            media = message.audio
             file_name = message.audio.file_name or "audio.mp3"
         else:
             bot.reply_to(message, "❌ Unsupported file type")
             return
 
+        # Fail fast instead of after a download that can't succeed
+        if media.file_size and media.file_size > MAX_FILE_SIZE:
+            bot.reply_to(message, "❌ File too large! Maximum file size: 20MB")
+            return
+
         # Send processing message
         processing_msg = bot.reply_to(message, "⏳ Processing file... Please wait.")
-        # Download file
-        downloaded_file = bot.download_file(file_info.file_path)
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile() as temp_file:
-            temp_file.write(downloaded_file)
-            temp_file.seek(0)
-
-            # Generate hashes
-            hashes = get_file_hash(temp_file)
+        try:
+            hashes = telegram_file_hash(TelegramFile(media.file_unique_id, media.file_id))
+        except requests.RequestException as e:
+            # The download URL embeds the bot token, and so does the error text:
+            # log it redacted and never show it to the user
+            logger.error("File download failed: %s", redact(str(e)))
+            bot.edit_message_text(
+                "❌ Could not download the file from Telegram. Please try again.",
+                message.chat.id,
+                processing_msg.message_id,
+            )
+            return
 
         # Format response
-        response = f"📎 <b>File Hash Results</b>\n\n"
-        response += f"<b>File:</b> <code>{file_name}</code>\n"
-
-        for algo, hash_value in hashes.items():
-            response += f"<b>{algo.upper()}:</b>\n<code>{hash_value}</code>\n\n"
+        parts = ["📎 <b>File Hash Results</b>", "", f"<b>File:</b> <code>{html.escape(file_name)}</code>"]
+        parts.extend(
+            f"<b>{algo.upper()}:</b>\n<code>{hash_value}</code>\n"
+            for algo, hash_value in hashes.items()
+        )
+
+        if message.photo:
+            parts.append(
+                "💡 To hide a message in this photo, send it with caption: "
+                "<code>/stegano cipher keyword secret message</code>"
+            )
 
         # Delete processing message and send result
         bot.delete_message(message.chat.id, processing_msg.message_id)
-        bot.reply_to(message, response, parse_mode="HTML")
+        bot.reply_to(message, "\n".join(parts), parse_mode="HTML")
 
+    except requests.RequestException as e:
+        # Errors from any Bot API call carry the token in their URL
+        logger.error("Telegram request failed: %s", redact(str(e)))
+        bot.reply_to(message, "❌ Could not reach Telegram. Please try again.")
     except Exception as e:
         bot.reply_to(message, f"❌ Error processing file: {str(e)}")
 
 
-@bot.message_handler(content_types=["photo"])
-def handle_photo_without_command(message):
-    """Handle photos sent without steganography command"""
-    bot.reply_to(message, 
-        "📸 **Photo received!**\n\n"
-        "💡 **For steganography operations:**\n"
-        "• Send photo with caption: `/stegano cipher keyword secret message`\n"
-        "• Or: `/stegano decipher` to reveal hidden message\n\n"
-        "ℹ️ Use `/help` for other commands", 
-        parse_mode="Markdown")
-
 @bot.message_handler(commands=["stegano", "steganography"])
 def stegano_command_only(message):
     """Handle steganography commands without photo"""
-    help_text = """🔐 **Steganography Help**
+    bot.reply_to(message, STEGANO_HELP, parse_mode="Markdown")
 
-**Hide message in image:**
-1. Send photo with caption: `/stegano cipher keyword your_secret_message`
 
-**Reveal hidden message:**
-1. Send photo with caption: `/stegano decipher keyword`
-
-**Example:**
-📸 Send photo + `/stegano cipher mykey Hello World!`
-📸 Send encoded photo + `/stegano decipher mykey`
-
-⚠️ **Note:** Both operations require sending a photo!"""
-    
-    bot.reply_to(message, help_text, parse_mode="Markdown")
-
-@bot.message_handler(content_types=["photo"])
-def handle_photo_with_caption(message):
-    """Handle photos with captions that might contain steganography commands"""
-    if not message.caption:
-        return  # Let the other handler deal with it
-    
+def handle_stegano_caption(message):
+    """Handle images whose caption is a steganography command"""
     caption = message.caption.strip()
-    if not caption.startswith('/stegano') and not caption.startswith('/steganography'):
-        return  # Not a steganography command
-    
+
     try:
         # Parse the caption command
         args = caption.split()
@@ -206,9 +350,21 @@ def handle_photo_with_caption(message):
                 parse_mode="Markdown")
             return
 
-        # Get the largest photo (highest resolution)
-        file_info = bot.get_file(message.photo[-1].file_id)
+        # Get the largest photo (highest resolution), or the uncompressed
+        # image when it was sent as a file
+        media = message.photo[-1] if message.photo else message.document
+        if media.file_size and media.file_size > MAX_FILE_SIZE:
+            bot.reply_to(message, "❌ File too large! Maximum file size: 20MB")
+            return
+
+        file_info = bot.get_file(media.file_id)
         downloaded_file = bot.download_file(file_info.file_path)
+        # Decode in memory; lsb works on PIL images directly. open only reads
+        # the header, so the size check runs before any pixels are decoded
+        image = Image.open(io.BytesIO(downloaded_file))
+        if image.width * image.height > MAX_STEGANO_PIXELS:
+            bot.reply_to(message, "❌ Image too large! Maximum size: 25 megapixels")
+            return
 
         # Processing message
         processing_msg = bot.reply_to(message, "⏳ Processing steganography operation...")
@@ -226,35 +382,33 @@ def handle_photo_with_caption(message):
             secret_message = " ".join(args[3:])  # Join all remaining words
             
             # Create cipher object
-            mix = MixedAlphabet(keyword)
+            mix = mixed_alphabet(keyword)
             encrypted_message = mix.cipher(secret_message)
 
-            # Create temporary file for input image
-            with tempfile.NamedTemporaryFile(suffix='.png') as temp_file:
-                temp_file.write(downloaded_file)
-                temp_file.flush()  # Ensure data is written
-                
-                # Hide the encrypted message in the image
-                secret_image = lsb.hide(temp_file.name, encrypted_message)
-                
-                # Create output buffer
-                output_buffer = io.BytesIO()
-                secret_image.save(output_buffer, format='PNG')
-                output_buffer.seek(0)  # Reset to beginning
-                
-                # Send the steganographed image
-                bot.delete_message(message.chat.id, processing_msg.message_id)
-                bot.send_document(
-                    message.chat.id,
-                    output_buffer,
-                    visible_file_name="steganographed_image.png",
-                    caption=f"🔐 **Message hidden successfully!**\n\n"
-                           f"🔑 **Keyword:** `{keyword}`\n"
-                           f"📝 **Original message:** `{secret_message}`\n"
-                           f"🔒 **Encrypted message:** `{encrypted_message}`\n\n"
-                           f"💡 **To reveal:** Send this image with `/stegano decipher {keyword}`",
-                    parse_mode="Markdown"
-                )
+            # Hide the encrypted message in the image
+            secret_image = lsb.hide(image, encrypted_message)
+
+            # Create output buffer
+            output_buffer = io.BytesIO()
+            # LSB-modified pixels barely compress, so spend little effort trying
+            secret_image.save(output_buffer, format='PNG', compress_level=1, optimize=False)
+            output_buffer.seek(0)  # Reset to beginning
+
+            # Send the steganographed image first so the user isn't waiting on
+            # the cleanup call; a text message can't be edited into a document
+            bot.send_document(
+                message.chat.id,
+                output_buffer,
+                visible_file_name="steganographed_image.png",
+                # User text is escaped so characters like <, & or ` can't break the markup
+                caption=f"🔐 <b>Message hidden successfully!</b>\n\n"
+                       f"🔑 <b>Keyword:</b> <code>{html.escape(keyword)}</code>\n"
+                       f"📝 <b>Original message:</b> <code>{html.escape(secret_message)}</code>\n"
+                       f"🔒 <b>Encrypted message:</b> <code>{html.escape(encrypted_message)}</code>\n\n"
+                       f"💡 <b>To reveal:</b> Send this image with <code>/stegano decipher {html.escape(keyword)}</code>",
+                parse_mode="HTML"
+            )
+            bot.delete_message(message.chat.id, processing_msg.message_id)
 
         elif operation == "decipher":
             # Reveal message
@@ -268,115 +422,94 @@ def handle_photo_with_caption(message):
             keyword = args[2]
             
             # Create cipher object
-            mix = MixedAlphabet(keyword)
-
-            # Create temporary file for processing
-            with tempfile.NamedTemporaryFile(suffix='.png') as temp_file:
-                temp_file.write(downloaded_file)
-                temp_file.flush()
-                
-                try:
-                    # Reveal the hidden encrypted message
-                    encrypted_message = lsb.reveal(temp_file.name)
-                    
-                    if not encrypted_message:
-                        bot.edit_message_text(
-                            "❌ **No hidden message found!**\n\n"
-                            "This image doesn't contain steganographic data or "
-                            "was processed with different settings.",
-                            message.chat.id, processing_msg.message_id)
-                        return
-                    
-                    # Decrypt the message
-                    decrypted_message = mix.decipher(encrypted_message)
-                    
-                    # Send results
-                    bot.edit_message_text(
-                        f"🔓 **Message revealed successfully!**\n\n"
-                        f"🔑 **Keyword:** `{keyword}`\n"
-                        f"🔒 **Encrypted:** `{encrypted_message}`\n"
-                        f"📝 **Decrypted:** `{decrypted_message}`",
-                        message.chat.id, processing_msg.message_id, parse_mode="Markdown")
-                    
-                except Exception as e:
+            mix = mixed_alphabet(keyword)
+
+            try:
+                # Reveal the hidden encrypted message
+                encrypted_message = lsb.reveal(image)
+
+                if not encrypted_message:
                     bot.edit_message_text(
-                        f"❌ **Error revealing message:**\n\n"
-                        f"• No hidden message found, or\n"
-                        f"• Wrong keyword used, or\n"
-                        f"• Image wasn't processed with steganography\n\n"
-                        f"**Error details:** `{str(e)}`",
-                        message.chat.id, processing_msg.message_id, parse_mode="Markdown")
+                        "❌ **No hidden message found!**\n\n"
+                        "This image doesn't contain steganographic data or "
+                        "was processed with different settings.",
+                        message.chat.id, processing_msg.message_id)
+                    return
 
+                # Decrypt the message
+                decrypted_message = mix.decipher(encrypted_message)
+
+                # Send results
+                bot.edit_message_text(
+                    f"🔓 <b>Message revealed successfully!</b>\n\n"
+                    f"🔑 <b>Keyword:</b> <code>{html.escape(keyword)}</code>\n"
+                    f"🔒 <b>Encrypted:</b> <code>{html.escape(encrypted_message)}</code>\n"
+                    f"📝 <b>Decrypted:</b> <code>{html.escape(decrypted_message)}</code>",
+                    message.chat.id, processing_msg.message_id, parse_mode="HTML")
+
+            except Exception as e:
+                bot.edit_message_text(
+                    f"❌ <b>Error revealing message:</b>\n\n"
+                    f"• No hidden message found, or\n"
+                    f"• Wrong keyword used, or\n"
+                    f"• Image wasn't processed with steganography\n\n"
+                    f"<b>Error details:</b> <code>{html.escape(str(e))}</code>",
+                    message.chat.id, processing_msg.message_id, parse_mode="HTML")
+
+    except requests.RequestException as e:
+        # get_file/download_file errors carry the token in their URL
+        logger.error("Telegram request failed: %s", redact(str(e)))
+        bot.reply_to(message, "❌ Could not download the image from Telegram. Please try again.")
     except Exception as e:
         bot.reply_to(message, f"❌ **Steganography error:** {str(e)}")
 
 @bot.message_handler(commands=["cipher", "decipher", "encrypt", "decrypt"])
 def cipher_command(message):
-    args = message.text.split()
+    # Only split off the command and algorithm; the rest is kept verbatim
+    args = message.text.split(maxsplit=2)
 
     # Extract operation
     op = args[0][1:].lower()
 
     if len(args) < 3:
-        help_text = """❌ Usage: /{operation} <algorithm> [keyword] <text>
-
-        *Operations:* cipher, decipher, encrypt, decrypt
-        *Algorithms:* atbash, caesar, simple_substitution, baconian, rot13, shift, mixed_alphabet
-
-        *Examples:*
-        • /cipher atbash hello world
-        • /encrypt mixed_alphabet secret hello world
-        • /decrypt caesar hello world"""
-        bot.reply_to(message, help_text)
+        bot.reply_to(message, CIPHER_USAGE)
         return
 
     algo = args[1].lower()
 
-    cipher_classes = {
-        "atbash": Atbash,
-        "caesar": Caesar,
-        "simple_substitution": SimpleSubstitution,
-        "baconian": Baconian,
-        "rot13": Rot13,
-        "shift": Shift,
-        "mixed_alphabet": MixedAlphabet,
-    }
-
-    cipher_class = cipher_classes.get(algo)
+    cipher_class = CIPHER_CLASSES.get(algo)
 
     if not cipher_class:
-        available = ", ".join(cipher_classes.keys())
-        result = f"❌ Algorithm '{algo}' not supported\nAvailable: {available}"
+        result = f"❌ Algorithm '{algo}' not supported\nAvailable: {AVAILABLE_ALGOS}"
         bot.reply_to(message, result)
         return
 
     try:
         # Handle special cases that require parameters
         if algo == "mixed_alphabet":
-            if len(args) < 4:
+            keyword_args = args[2].split(maxsplit=1)
+            if len(keyword_args) < 2:
                 bot.reply_to(
                     message,
                     f"❌ Mixed alphabet requires keyword!\nUsage: /{op} mixed_alphabet <keyword> <text>",
                 )
                 return
 
-            keyword = args[2]
-            text = " ".join(args[3:])
-            cipher_instance = cipher_class(keyword)
+            keyword, text = keyword_args
+            cipher_instance = mixed_alphabet(keyword)
 
         else:
-            text = " ".join(args[2:])
-            cipher_instance = cipher_class()
+            text = args[2]
+            cipher_instance = CIPHER_INSTANCES.get(algo) or cipher_class()
 
         if not text.strip():
             bot.reply_to(message, "❌ Please provide text to process!")
             return
 
         # Call the correct method based on operation
-        if op in ["cipher", "encrypt"]:
-            result = cipher_instance.cipher(text=text)
-        elif op in ["decipher", "decrypt"]:
-            result = cipher_instance.decipher(text=text)
+        method_name = OP_METHOD.get(op)
+        if method_name:
+            result = getattr(cipher_instance, method_name)(text=text)
         else:
             result = "❌ Invalid operation. Use: cipher, decipher, encrypt, or decrypt"
 
@@ -384,9 +517,9 @@ def cipher_command(message):
         response = f"🔐 <b>Algorithm:</b> {algo.upper()}\n"
         response += f"<b>Operation:</b> {op.upper()}\n"
         if algo == "mixed_alphabet":
-            response += f"<b>Keyword:</b> <code>{keyword}</code>\n"
-        response += f"<b>Input:</b> <code>{text}</code>\n"
-        response += f"<b>Output:</b> <code>{result}</code>"
+            response += f"<b>Keyword:</b> <code>{html.escape(keyword)}</code>\n"
+        response += f"<b>Input:</b> <code>{html.escape(text)}</code>\n"
+        response += f"<b>Output:</b> <code>{html.escape(result)}</code>"
 
         bot.reply_to(message, response, parse_mode="HTML")
 
@@ -395,4 +528,6 @@ def cipher_command(message):
         bot.reply_to(message, result)
 
 
-bot.infinity_polling()
+# Long polling: getUpdates blocks server-side until an update arrives, so an
+# idle bot makes about one request a minute instead of one every 20 seconds
+bot.infinity_polling(timeout=60, long_polling_timeout=60, skip_pending=True)
@@ -15,7 +15,7 @@ The following ciphers are implemented:
 - PolybiusSquare: A substitution cipher that uses a 5x5 grid to represent each letter.
 """
 
-import string, random
+import re, string, random
 
 
 class SubstitutionCipher:
@@ -36,6 +36,8 @@ class SubstitutionCipher:
         """
         self.cipher_alphabets = cipher_alphabets
         self.mapping = self.cipher_mapping()
+        self.inverse_mapping = self.inverse_cipher_mapping()
+        self.cipher_table, self.decipher_table = self.translation_tables()
 
     # creating mapping of alphanets to cipher_alphanets
     # examples : for atbash cipher
@@ -57,6 +59,42 @@ class SubstitutionCipher:
 
         return mapping
 
+    def inverse_cipher_mapping(self):
+        """
+        Creates the reverse mapping, from the cipher alphabet back to the standard alphabet.
+
+        Returns:
+            A dictionary containing separate mappings for lowercase and uppercase letters.
+        """
+        return {
+            case: {v: k for k, v in mapping.items()}
+            for case, mapping in self.mapping.items()
+        }
+
+    def translation_tables(self):
+        """
+        Builds str.translate tables from the mapping.
+
+        The decipher table only covers single-character cipher letters; ciphers
+        with multi-character codes (Baconian, PolybiusSquare) decode themselves.
+
+        Returns:
+            A tuple of (cipher_table, decipher_table).
+        """
+        cipher_table = str.maketrans(
+            {**self.mapping["lowercase"], **self.mapping["uppercase"]}
+        )
+
+        # Only invert letters of the matching case, as the per-letter lookup did
+        decipher_mapping = {}
+        for case, is_case in (("lowercase", str.islower), ("uppercase", str.isupper)):
+            for k, v in self.inverse_mapping[case].items():
+                if len(k) == 1 and is_case(k):
+                    decipher_mapping[k] = v
+        decipher_table = str.maketrans(decipher_mapping)
+
+        return cipher_table, decipher_table
+
     def cipher(self, text: str) -> str:
         """
         Encrypts the given text using the substitution cipher.
@@ -67,17 +105,8 @@ class SubstitutionCipher:
         Returns:
             The encrypted text.
         """
-        cipher_text = ""
-        for letter in text:
-            if letter.islower():
-                cipher_text += self.mapping["lowercase"].get(
-                    letter, letter
-                )  # two letter parameters because if the letter doesn't include in the mapping, it will fallback to default i.e second letter parameter which is original letter
-            elif letter.isupper():
-                cipher_text += self.mapping["uppercase"].get(letter, letter)
-            else:
-                cipher_text += letter
-        return cipher_text
+        # Characters missing from the table (digits, punctuation, ...) are kept
+        return text.translate(self.cipher_table)
 
     def decipher(self, text: str) -> str:
         """
@@ -89,19 +118,36 @@ class SubstitutionCipher:
         Returns:
             The decrypted text.
         """
-        # Reverse the mapping for both cases
-        inverse_lower = {v: k for k, v in self.mapping["lowercase"].items()}
-        inverse_upper = {v: k for k, v in self.mapping["uppercase"].items()}
+        return text.translate(self.decipher_table)
 
-        plain_text = ""
-        for letter in text:
-            if letter.islower():
-                plain_text += inverse_lower.get(letter, letter)
-            elif letter.isupper():
-                plain_text += inverse_upper.get(letter, letter)
+    @staticmethod
+    def decode_blocks(text: str, decode_map: dict, word_length: int) -> str:
+        """
+        Decodes text made of fixed-width codes, word by word.
+
+        Spaces, newlines and tabs separate words and are kept as they are; a
+        code missing from decode_map becomes "?".
+
+        Args:
+            text: The text to be decoded.
+            decode_map: A dictionary from each code to its letter.
+            word_length: The width of each code.
+
+        Returns:
+            The decoded text.
+        """
+        decode = decode_map.get
+        plain_text = []
+        # Odd-indexed parts are the separators captured by the split
+        for i, part in enumerate(re.split(r"([ \n\t]+)", text)):
+            if i % 2:
+                plain_text.append(part)
             else:
-                plain_text += letter
-        return plain_text
+                plain_text.extend(
+                    decode(part[j : j + word_length], "?")
+                    for j in range(0, len(part), word_length)
+                )
+        return "".join(plain_text)
 
 
 class MixedAlphabet(SubstitutionCipher):
@@ -131,14 +177,13 @@ class MixedAlphabet(SubstitutionCipher):
             A list of characters representing the mixed cipher alphabet.
         """
         # Make keyword unique while preserving order
-        unique_keyword = list(dict.fromkeys(self.keyword))
-
-        alphabets = string.ascii_lowercase
-        cipher_alphabet = unique_keyword
+        unique_keyword = dict.fromkeys(self.keyword)
 
-        for letter in alphabets:
-            if letter not in cipher_alphabet:
-                cipher_alphabet.append(letter)
+        cipher_alphabet = list(unique_keyword)
+        # unique_keyword doubles as the set of letters already used
+        cipher_alphabet.extend(
+            letter for letter in string.ascii_lowercase if letter not in unique_keyword
+        )
 
         return cipher_alphabet
 
@@ -220,11 +265,27 @@ class Rotate(SubstitutionCipher):
         Returns:
             A list of characters representing the rotated alphabet.
         """
-        # small letter in ASCII start from 97, in ASCII a = 97
-        return [
-            chr((ord(char) - 97 + self.shift) % 26 + 97)
-            for char in string.ascii_lowercase
-        ]
+        # Rotating the alphabet is one slice-and-concatenate
+        alphabet = string.ascii_lowercase
+        shift = self.shift % 26
+        return list(alphabet[shift:] + alphabet[:shift])
+
+    def translation_tables(self):
+        """
+        Builds the translate tables directly from the rotated alphabet.
+
+        A rotation is a 1:1 permutation of a-z/A-Z, so both tables come from
+        the two-string form of str.maketrans without inverting the mapping.
+
+        Returns:
+            A tuple of (cipher_table, decipher_table).
+        """
+        rotated = "".join(self.cipher_alphabets)
+        rotated += rotated.upper()
+        return (
+            str.maketrans(string.ascii_letters, rotated),
+            str.maketrans(rotated, string.ascii_letters),
+        )
 
 
 class Caesar(Rotate):
@@ -350,6 +411,15 @@ class Baconian(SubstitutionCipher):
 
         super().__init__(cipher_alphabet)
 
+        # Lowercase and uppercase codes never collide, so one dict decodes both
+        self.decode_map = {
+            **self.inverse_mapping["uppercase"],
+            **self.inverse_mapping["lowercase"],
+        }
+
+    # Encryption needs no override: the base class's str.translate table
+    # already expands each letter to its 5-character code
+
     def decipher(self, text: str) -> str:
         """
         Decrypts the given text using the Baconian cipher.
@@ -360,23 +430,7 @@ class Baconian(SubstitutionCipher):
         Returns:
             The decrypted text.
         """
-        inverse_lower = {v: k for k, v in self.mapping["lowercase"].items()}
-        inverse_upper = {v: k for k, v in self.mapping["uppercase"].items()}
-        plain_text = ""
-        i = 0
-        word_length = 5
-        while i < len(text):
-            if text[i] in [" ", "\n", "\t"]:  # You can expand this list for more
-                plain_text += text[i]
-                i += 1
-            else:
-                block = text[i : i + word_length]
-                if block[0].islower():
-                    plain_text += inverse_lower.get(block, "?")
-                else:
-                    plain_text += inverse_upper.get(block, "?")
-                i += word_length
-        return plain_text
+        return self.decode_blocks(text, self.decode_map, 5)
 
 
 class PolybiusSquare(SubstitutionCipher):
@@ -419,6 +473,20 @@ class PolybiusSquare(SubstitutionCipher):
         """
         super().__init__(self.cipher_alphabets)
 
+        # Digit codes have no case, so the lowercase inverse covers both
+        self.decode_map = self.inverse_mapping["lowercase"]
+
+    def translation_tables(self):
+        """
+        Builds the translate tables, with the cipher table also dropping digits.
+
+        Returns:
+            A tuple of (cipher_table, decipher_table).
+        """
+        cipher_table, decipher_table = super().translation_tables()
+        cipher_table.update(dict.fromkeys(map(ord, string.digits)))
+        return cipher_table, decipher_table
+
     def cipher(self, text: str) -> str:
         """
         Encrypts the given text using the PolybiusSquare cipher.
@@ -429,19 +497,27 @@ class PolybiusSquare(SubstitutionCipher):
         Returns:
             The encrypted text.
         """
-        cipher_text = ""
+        # ASCII digits are the only ASCII numerics, so the table covers it all
+        if text.isascii():
+            return text.translate(self.cipher_table)
+
+        # Bind the lookups once so the loop body does no attribute lookups
+        lower_get = self.mapping["lowercase"].get
+        upper_get = self.mapping["uppercase"].get
+        cipher_text = []
+        append = cipher_text.append
         for letter in text:
             if letter.islower():
-                cipher_text += self.mapping["lowercase"].get(
-                    letter, letter
+                append(
+                    lower_get(letter, letter)
                 )  # two letter parameters because if the letter doesn't include in the mapping, it will fallback to default i.e second letter parameter which is original letter
             elif letter.isupper():
-                cipher_text += self.mapping["uppercase"].get(letter, letter)
+                append(upper_get(letter, letter))
             elif letter.isnumeric():
-                cipher_text += ""
+                continue
             else:
-                cipher_text += letter
-        return cipher_text
+                append(letter)
+        return "".join(cipher_text)
 
     def decipher(self, text: str) -> str:
         """
@@ -453,20 +529,7 @@ class PolybiusSquare(SubstitutionCipher):
         Returns:
             The decrypted text.
         """
-        inverse_lower = {v: k for k, v in self.mapping["lowercase"].items()}
-        inverse_upper = {v: k for k, v in self.mapping["uppercase"].items()}
-        plain_text = ""
-        i = 0
-        word_length = 2
-        while i < len(text):
-            if text[i] in [" ", "\n", "\t"]:  # You can expand this list for more
-                plain_text += text[i]
-                i += 1
-            else:
-                block = text[i : i + word_length]
-                plain_text += inverse_lower.get(block, "?")
-                i += word_length
-        return plain_text
+        return self.decode_blocks(text, self.decode_map, 2)
 
 
 
@@ -0,0 +1,100 @@
+"""
+Least significant bit (LSB) steganography on PIL images, vectorised with NumPy.
+
+The message is stored as "<length>:<message>" in UTF-8, one bit in the lowest bit
+of each red, green and blue value, pixel by pixel in row-major order. For ASCII
+messages this is the same layout stegano's lsb.hide/lsb.reveal use, so images
+from either implementation can be read by the other.
+"""
+
+import numpy as np
+from PIL import Image
+
+# Enough bytes for the "<length>:" header of any message an image can hold
+HEADER_MAX_BYTES = 24
+
+
+def _pixels(image: Image.Image) -> np.ndarray:
+    """
+    Returns the image as a (pixel count, channels) uint8 array.
+
+    Args:
+        image: The image to read. Modes other than RGB/RGBA are converted to RGB.
+
+    Returns:
+        A writable copy of the pixel data, one row per pixel.
+    """
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGB")
+    pixels = np.array(image, dtype=np.uint8)
+    return pixels.reshape(-1, pixels.shape[-1])
+
+
+def _read_bytes(pixels: np.ndarray, length: int) -> bytes:
+    """
+    Reads the first `length` hidden bytes from the RGB low bits.
+
+    Args:
+        pixels: Pixel array as returned by _pixels.
+        length: Number of bytes to read.
+
+    Returns:
+        The hidden bytes.
+    """
+    bit_count = length * 8
+    pixel_count = -(-bit_count // 3)  # ceil division
+    bits = (pixels[:pixel_count, :3] & 1).reshape(-1)[:bit_count]
+    return np.packbits(bits).tobytes()
+
+
+def hide(image: Image.Image, message: str) -> Image.Image:
+    """
+    Hides a message in the low bits of an image.
+
+    Args:
+        image: The cover image.
+        message: The text to hide.
+
+    Returns:
+        A new image containing the message.
+    """
+    data = message.encode("utf-8")
+    payload = str(len(data)).encode("ascii") + b":" + data
+
+    pixels = _pixels(image)
+    bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+    pixel_count = -(-bits.size // 3)  # ceil division
+    if pixel_count > pixels.shape[0]:
+        raise ValueError(f"The message you want to hide is too long: {len(data)}")
+
+    # Pad to a whole number of pixels, then overwrite only the pixels needed
+    bits = np.pad(bits, (0, pixel_count * 3 - bits.size)).reshape(pixel_count, 3)
+    pixels[:pixel_count, :3] = (pixels[:pixel_count, :3] & 0xFE) | bits
+
+    return Image.fromarray(pixels.reshape(image.height, image.width, -1))
+
+
+def reveal(image: Image.Image) -> str:
+    """
+    Reveals a message hidden with hide.
+
+    Args:
+        image: The image containing the message.
+
+    Returns:
+        The hidden message.
+    """
+    pixels = _pixels(image)
+    capacity = pixels.shape[0] * 3 // 8
+
+    header = _read_bytes(pixels, min(HEADER_MAX_BYTES, capacity))
+    length, separator, _ = header.partition(b":")
+    if not separator or not length.isdigit():
+        raise ValueError("Impossible to detect message.")
+
+    start = len(length) + 1
+    end = start + int(length)
+    if end > capacity:
+        raise ValueError("Impossible to detect message.")
+
+    return _read_bytes(pixels, end)[start:].decode("utf-8")
@@ -12,42 +12,18 @@ class RailFence:
 
         self.row_length = row_length
 
-    def create_pattern(self):
-        """boolean pattern to mark letter positions."""
-        s_length = len(self.s)
-        rails = [[None for _ in range(s_length)] for _ in range(self.row_length)]
-
-        row = 0
-        direction = 1
-        for col in range(s_length):
-            rails[row][col] = True
-            row += direction
-            if row == self.row_length - 1 or row == 0:
-                direction *= -1
-        return rails
-
-    def create_rail_fence(self):
-        """Fill zigzag pattern with characters for encryption."""
-        s_length = len(self.s)
-        rails = [[None for _ in range(s_length)] for _ in range(self.row_length)]
-
-        row = 0
-        direction = 1
-        for col, ch in enumerate(self.s):
-            rails[row][col] = ch
-            row += direction
-            if row == self.row_length - 1 or row == 0:
-                direction *= -1
-        return rails
-
-    def cipher(self, rail_matrix: list):
-        """Read row-by-row to get encrypted string."""
-        out = []
-        for row in rail_matrix:
-            for ch in row:
-                if ch is not None:
-                    out.append(ch)
-        return "".join(out)
+    def rail_rows(self):
+        """rail index of every column, from the zigzag period in O(1) per column."""
+        last = self.row_length - 1
+        period = 2 * last
+        return [last - abs(col % period - last) for col in range(len(self.s))]
+
+    def cipher(self):
+        """Group letters by rail, then read rail-by-rail to get encrypted string."""
+        rails = [[] for _ in range(self.row_length)]
+        for r, ch in zip(self.rail_rows(), self.s):
+            rails[r].append(ch)
+        return "".join("".join(rail) for rail in rails)
 
     def decipher(self):
         """Reverse the encryption process, returning the plaintext."""
@@ -55,26 +31,18 @@ class RailFence:
         if self.row_length < 2 or s_len == 0:
             return self.s  # identity cases
 
-        # Step 1: Build mask of positions in zigzag
-        mask = self.create_pattern()
+        # Step 1: Count how many letters land on each rail
+        rows = self.rail_rows()
+        counts = [0] * self.row_length
+        for r in rows:
+            counts[r] += 1
 
-        # Step 2: Fill row-by-row with the encrypted text
-        filled = [[None for _ in range(s_len)] for _ in range(self.row_length)]
-        idx = 0
-        for r in range(self.row_length):
-            for c in range(s_len):
-                if mask[r][c]:
-                    filled[r][c] = self.s[idx]
-                    idx += 1
+        # Step 2: Slice the encrypted text into one run per rail
+        rails = []
+        start = 0
+        for count in counts:
+            rails.append(iter(self.s[start : start + count]))
+            start += count
 
         # Step 3: Read in zigzag order to reconstruct plaintext
-        row = 0
-        direction = 1
-        out = []
-        for c in range(s_len):
-            out.append(filled[row][c])
-            row += direction
-            if row == self.row_length - 1 or row == 0:
-                direction *= -1
-
-        return "".join(out)
+        return "".join(next(rails[r]) for r in rows)
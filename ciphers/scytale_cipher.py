@@ -1,20 +1,30 @@
-from .columnar_transposition import ColumnarTransposition
+from .utils import omit_all_except_alpha
 
 
-class Scytale(ColumnarTransposition):
+class Scytale:
     def __init__(self, key: int = 3) -> None:
         self.key = key
 
-    def _create_grid(self, text: str):
-        column_len = self.key
-        row_len = -(-len(text) // self.key)  # ceil division
-        return [["" for _ in range(column_len)] for _ in range(row_len)]
-
-    def _get_key_order(self):
-        return range(self.key)
-
     def cipher(self, plaintext: str):
         if self.key >= len(plaintext) // 2:
             raise ValueError("Key should be less than half size of text")
-        else:
-            return super().cipher(plaintext)
+        # Columns are read in their natural order: every key-th letter from i
+        text = omit_all_except_alpha(plaintext).upper()
+        return "".join(text[i::self.key] for i in range(self.key))
+
+    def decipher(self, ciphertext: str):
+        ciphertext = omit_all_except_alpha(ciphertext).upper()
+        full_rows, extra = divmod(len(ciphertext), self.key)
+
+        # Split back into the key columns; the first `extra` are one longer
+        chunks = []
+        idx = 0
+        for i in range(self.key):
+            length = full_rows + (i < extra)
+            chunks.append(ciphertext[idx : idx + length])
+            idx += length
+
+        # Row r is the r-th letter of every column long enough to have one
+        return "".join(
+            chunk[r] for r in range(full_rows + 1) for chunk in chunks if r < len(chunk)
+        )
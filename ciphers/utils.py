@@ -1,10 +1,21 @@
+# Deletion tables for ASCII whitespace and every non-letter ASCII character
+_DELETE_SPACES = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i).isspace())
+)
+_DELETE_NON_ALPHA = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not chr(i).isalpha())
+)
+
+
 def omit_blank_spaces(s: str):
+    if s.isascii():
+        return s.translate(_DELETE_SPACES)
+    # Unicode whitespace (e.g. no-break space) is only known to str.split
     return "".join(s.split())
 
 
 def omit_all_except_alpha(s: str):
-    result = ""
-    for c in s:
-        if c.isalpha():
-            result += c
-    return result
+    if s.isascii():
+        return s.translate(_DELETE_NON_ALPHA)
+    # Unicode letters need str.isalpha; filter still runs the loop in C
+    return "".join(filter(str.isalpha, s))